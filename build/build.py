@@ -166,9 +166,10 @@ def convert_to_unix_line_endings(file_path: Path):
     """Convert a file from Windows (CRLF) to Unix (LF) line endings."""
     try:
         content = file_path.read_bytes()
-        if b'\r\n' in content:
-            content = content.replace(b'\r\n', b'\n')
-            file_path.write_bytes(content)
+        # Single replace pass; a length change means CRLF was present
+        converted = content.replace(b'\r\n', b'\n')
+        if len(converted) != len(content):
+            file_path.write_bytes(converted)
             return True
     except Exception as e:
         print_warn(f"Could not convert {file_path.name}: {e}")
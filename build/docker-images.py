@@ -89,6 +89,9 @@ def print_error(msg): print(f"{Colors.RED}❌ {msg}{Colors.RESET}")
 class DockerImagesManager:
     """Manages Docker image versions for Runtipi."""
     
+    # Image line in docker-compose.yml: image: traefik:v3.6.1
+    IMAGE_PATTERN = re.compile(r'^\s*image:\s*((traefik|postgres|rabbitmq):[^\s]+)', re.MULTILINE)
+    
     def __init__(self):
         self.cache_file = IMAGES_CACHE_FILE
         self.pre_install = PRE_INSTALL_FILE
@@ -140,19 +143,16 @@ class DockerImagesManager:
             with urllib.request.urlopen(req, timeout=10) as response:
                 compose_content = response.read().decode('utf-8')
                 
-                # Parse image versions from docker-compose.yml
-                # Pattern: image: traefik:v3.6.1
-                patterns = {
-                    'traefik': r'^\s*image:\s*(traefik:[^\s]+)',
-                    'postgres': r'^\s*image:\s*(postgres:[^\s]+)',
-                    'rabbitmq': r'^\s*image:\s*(rabbitmq:[^\s]+)',
-                }
-                
-                for key, pattern in patterns.items():
-                    match = re.search(pattern, compose_content, re.MULTILINE)
-                    if match:
-                        images[key] = match.group(1)
-                        print_info(f"  Found {key}: {images[key]}")
+                # Parse image versions from docker-compose.yml in a single pass
+                # (first occurrence of each image wins)
+                found = set()
+                for match in self.IMAGE_PATTERN.finditer(compose_content):
+                    key = match.group(2)
+                    if key in found:
+                        continue
+                    found.add(key)
+                    images[key] = match.group(1)
+                    print_info(f"  Found {key}: {images[key]}")
                 
                 print_success("docker-compose.yml parsed successfully")
                 
@@ -182,8 +182,11 @@ class DockerImagesManager:
             
             with urllib.request.urlopen(req, timeout=10) as response:
                 release = json.loads(response.read().decode('utf-8'))
-                body = release.get('body', '')
-                
+                body = release.get('body')
+                if not body:
+                    # Empty (or null) release body, nothing to scan
+                    return
+
                 # Look for traefik version in release notes
                 traefik_match = re.search(r'traefik[^\d]*v?(\d+\.\d+(?:\.\d+)?)', body, re.I)
                 if traefik_match:
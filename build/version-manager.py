@@ -71,7 +71,9 @@ class VersionManager:
     """Manages ASUSTOR package versions with revision support."""
     
     # Version pattern: X.Y.Z or X.Y.Z.rN
-    VERSION_PATTERN = re.compile(r'^(\d+\.\d+\.\d+)(?:\.r(\d+))?$')
+    VERSION_PATTERN = re.compile(r'(\d+\.\d+\.\d+)(?:\.r(\d+))?')
+    # Tag pattern for sorting: vX.Y.Z or vX.Y.Z.rN, split into numeric parts
+    TAG_SORT_PATTERN = re.compile(r'v?(\d+)\.(\d+)\.(\d+)(?:\.r(\d+))?')
     
     def __init__(self, config_path: Path = CONFIG_FILE):
         self.config_path = config_path
@@ -96,7 +98,7 @@ class VersionManager:
         Returns:
             Tuple of (base_version, revision) where revision is None if no revision
         """
-        match = self.VERSION_PATTERN.match(version)
+        match = self.VERSION_PATTERN.fullmatch(version)
         if not match:
             raise ValueError(f"Invalid version format: {version}")
         base = match.group(1)
@@ -105,9 +107,8 @@ class VersionManager:
     
     def format_version(self, base: str, revision: Optional[int]) -> str:
         """Format base version and revision into version string."""
-        if revision is None or revision == 0:
-            return base
-        return f"{base}.r{revision}"
+        # None and 0 both mean "no revision"
+        return f"{base}.r{revision}" if revision else base
     
     def get_git_tags(self) -> list:
         """Get list of git tags (version tags only)."""
@@ -127,14 +128,11 @@ class VersionManager:
     
     def _version_sort_key(self, tag: str) -> tuple:
         """Create a sort key for version tags."""
-        # Remove 'v' prefix
-        version = tag[1:] if tag.startswith('v') else tag
-        try:
-            base, revision = self.parse_version(version)
-            parts = [int(p) for p in base.split('.')]
-            return (*parts, revision or 0)
-        except ValueError:
+        match = self.TAG_SORT_PATTERN.fullmatch(tag)
+        if not match:
             return (0, 0, 0, 0)
+        major, minor, patch, revision = match.groups()
+        return (int(major), int(minor), int(patch), int(revision or 0))
     
     def get_latest_tag_for_base(self, base_version: str) -> Optional[str]:
         """Get the latest tag for a specific base version.